@@ -1,6 +1,6 @@
 import ast
 from collections import namedtuple
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple, Union, cast
 
 from graphql import (
     DirectiveNode,
@@ -127,10 +127,9 @@ def parse_operation_field_type(
             schema, field.selection_set, fragments_definitions, type_.name
         )
         if inline_fragments or fragments_on_subtypes:
-            types = [
-                generate_annotation_name('"' + class_name + type_.name + '"', False)
-            ]
-            names = [FieldNames(class_name + type_.name, type_.name)]
+            interface_class_name = class_name + type_.name
+            types = [generate_annotation_name(f'"{interface_class_name}"', False)]
+            names = [FieldNames(interface_class_name, type_.name)]
             fragments_types_names = sorted(
                 {
                     f.type_condition.name.value
@@ -138,26 +137,23 @@ def parse_operation_field_type(
                 }
             )
             for fragment_type_name in fragments_types_names:
+                fragment_class_name = class_name + fragment_type_name
                 types.append(
-                    generate_annotation_name(
-                        '"' + class_name + fragment_type_name + '"', False
-                    )
-                )
-                names.append(
-                    FieldNames(class_name + fragment_type_name, fragment_type_name)
+                    generate_annotation_name(f'"{fragment_class_name}"', False)
                 )
+                names.append(FieldNames(fragment_class_name, fragment_type_name))
             return generate_union_annotation(types=types, nullable=nullable), names
 
         name = class_name + type_.name if add_type_name else class_name
         return (
-            generate_annotation_name('"' + name + '"', nullable),
+            generate_annotation_name(f'"{name}"', nullable),
             [FieldNames(name, type_.name)],
         )
 
     if isinstance(type_, GraphQLObjectType):
         name = class_name + type_.name if add_type_name else class_name
         return (
-            generate_annotation_name('"' + name + '"', nullable),
+            generate_annotation_name(f'"{name}"', nullable),
             [FieldNames(name, type_.name)],
         )
 
@@ -269,32 +265,57 @@ def get_fragments_on_subtype(
 
 
 def annotate_nested_unions(annotation: AnnotationSlice) -> AnnotationSlice:
-    if isinstance(annotation, ast.Tuple):
-        return generate_tuple(
-            [
-                annotate_nested_unions(cast(AnnotationSlice, elt))
-                for elt in annotation.elts
-            ]
-        )
+    """Wrap unions nested in given annotation with discriminated Annotated.
 
+    Annotation is updated in place, unions are replaced within their parents."""
     if isinstance(annotation, (ast.Name, ast.Call)):
         return annotation
+    if (
+        isinstance(annotation, ast.Subscript)
+        and isinstance(annotation.slice, ast.Name)
+        and not is_union(annotation)
+    ):
+        # shallow Optional[X] and List[X] annotations can't contain unions
+        return annotation
 
-    if isinstance(annotation.value, ast.Name) and annotation.value.id == UNION:
-        return generate_subscript(
-            value=generate_name(ANNOTATED),
-            slice_=generate_tuple(
-                [
-                    annotation,
-                    generate_pydantic_field(
-                        {DISCRIMINATOR_KEYWORD: generate_constant(TYPENAME_ALIAS)}
-                    ),
-                ]
-            ),
-        )
-
-    annotation.slice = annotate_nested_unions(cast(AnnotationSlice, annotation.slice))
-    return annotation
+    root: List[ast.expr] = [annotation]
+    stack: List[Tuple[Union[ast.Subscript, List[ast.expr]], Union[str, int]]] = [
+        (root, 0)
+    ]
+    while stack:
+        parent, key = stack.pop()
+        if isinstance(parent, list):
+            node = parent[cast(int, key)]
+        else:
+            node = getattr(parent, cast(str, key))
+
+        if isinstance(node, ast.Tuple):
+            stack.extend((node.elts, index) for index in range(len(node.elts)))
+        elif isinstance(node, ast.Subscript):
+            if is_union(node):
+                annotated = generate_annotated_union(node)
+                if isinstance(parent, list):
+                    parent[cast(int, key)] = annotated
+                else:
+                    setattr(parent, cast(str, key), annotated)
+            else:
+                stack.append((node, "slice"))
+
+    return cast(AnnotationSlice, root[0])
+
+
+def generate_annotated_union(annotation: ast.Subscript) -> ast.Subscript:
+    return generate_subscript(
+        value=generate_name(ANNOTATED),
+        slice_=generate_tuple(
+            [
+                annotation,
+                generate_pydantic_field(
+                    {DISCRIMINATOR_KEYWORD: generate_constant(TYPENAME_ALIAS)}
+                ),
+            ]
+        ),
+    )
 
 
 def is_nullable(annotation: Annotation) -> bool:
@@ -14,8 +14,8 @@ from graphql import (
     GraphQLNamedType,
     GraphQLNonNull,
     GraphQLObjectType,
-    GraphQLScalarType,
     GraphQLSchema,
+    GraphQLString,
     GraphQLUnionType,
     InlineFragmentNode,
     NameNode,
@@ -72,6 +72,29 @@ from .types import CodegenResultFieldType
 
 
 class ResultTypesGenerator:
+    __slots__ = (
+        "schema",
+        "operation_definition",
+        "enums_module_name",
+        "fragments_module_name",
+        "fragments_definitions",
+        "custom_scalars",
+        "convert_to_snake_case",
+        "plugin_manager",
+        "_operation_name",
+        "_imports",
+        "_public_names",
+        "_parsed_class_names",
+        "_typename_field",
+        "_used_enums",
+        "_used_scalars",
+        "_fragments_used_as_mixins",
+        "_unpacked_fragments",
+        "_resolved_fragments",
+        "_operation_str",
+        "_class_defs",
+    )
+
     def __init__(
         self,
         schema: GraphQLSchema,
@@ -107,10 +130,16 @@ class ResultTypesGenerator:
             or generate_import_from([BASE_MODEL_CLASS_NAME], PYDANTIC_MODULE),
         ]
         self._public_names: List[str] = []
-        self._used_enums: List[str] = []
-        self._used_scalars: List[str] = []
+        self._parsed_class_names: Set[str] = set()
+        self._typename_field = GraphQLField(type_=GraphQLNonNull(GraphQLString))
+        self._used_enums: Dict[str, None] = {}
+        self._used_scalars: Dict[str, None] = {}
         self._fragments_used_as_mixins: Set[str] = set()
         self._unpacked_fragments: Set[str] = set()
+        self._resolved_fragments: Dict[
+            Tuple[str, str], Tuple[List[FieldNode], Set[str]]
+        ] = {}
+        self._operation_str: Optional[str] = None
 
         if isinstance(
             self.operation_definition, FragmentDefinitionNode
@@ -156,14 +185,10 @@ class ResultTypesGenerator:
         raise NotSupported(f"Not supported operation type: {definition}")
 
     def generate(self) -> ast.Module:
-        model_rebuild_calls = [
+        module_body: List[ast.stmt] = [*self._imports, *self._class_defs]
+        module_body.extend(
             generate_expr(generate_method_call(class_def.name, MODEL_REBUILD_METHOD))
             for class_def in self._class_defs
-        ]
-        module_body = (
-            cast(List[ast.stmt], self._imports)
-            + cast(List[ast.stmt], self._class_defs)
-            + cast(List[ast.stmt], model_rebuild_calls)
         )
 
         module = generate_module(module_body)
@@ -180,21 +205,24 @@ class ResultTypesGenerator:
         return self._class_defs
 
     def get_operation_as_str(self) -> str:
-        operation_str = print_ast(
-            self._get_node_without_mixin_directive(self.operation_definition)
-        )
+        if self._operation_str is not None:
+            return self._operation_str
+
+        operations = [self._get_node_without_mixin_directive(self.operation_definition)]
         if self._fragments_used_as_mixins or self._unpacked_fragments:
-            for used_fragment in sorted(self._get_all_related_fragments()):
-                operation_str += "\n\n" + print_ast(
-                    self._get_node_without_mixin_directive(
-                        self.fragments_definitions[used_fragment]
-                    )
+            operations.extend(
+                self._get_node_without_mixin_directive(
+                    self.fragments_definitions[used_fragment]
                 )
+                for used_fragment in sorted(self._get_all_related_fragments())
+            )
+        operation_str = "\n\n".join(print_ast(o) for o in operations)
 
         if self.plugin_manager:
             operation_str = self.plugin_manager.generate_operation_str(
                 operation_str, operation_definition=self.operation_definition
             )
+        self._operation_str = operation_str
         return operation_str
 
     def get_generated_public_names(self) -> List[str]:
@@ -215,8 +243,9 @@ class ResultTypesGenerator:
         extra_bases: Optional[List[str]] = None,
         typename_values: Optional[List[str]] = None,
     ) -> List[ast.ClassDef]:
-        if class_name in self._public_names:
+        if class_name in self._parsed_class_names:
             return []
+        self._parsed_class_names.add(class_name)
         self._public_names.append(class_name)
 
         resolved_selection_set, fragments = self._resolve_selection_set(
@@ -238,35 +267,21 @@ class ResultTypesGenerator:
             class_bases.extend(extra_bases)
         class_def = generate_class_def(class_name, class_bases)
 
+        type_def = self.schema.type_map.get(type_name)
+        type_fields = cast(GraphQLObjectType, type_def).fields if type_def else {}
         extra_classes = []
         for lineno, field in enumerate(
             resolved_selection_set,
             start=1,
         ):
-            field_name = self._get_field_name(field)
-            name = self._process_field_name(field_name, field=field)
-            field_definition = self._get_field_from_schema(type_name, field.name.value)
-            annotation, default_value, field_types_names = parse_operation_field(
-                schema=self.schema,
+            field_implementation, field_types_names = self._parse_field(
                 field=field,
-                type_=cast(CodegenResultFieldType, field_definition.type),
-                directives=field.directives,
-                class_name=class_name + str_to_pascal_case(name),
-                typename_values=typename_values,
-                custom_scalars=self.custom_scalars,
-                fragments_definitions=self.fragments_definitions,
-            )
-
-            field_implementation = generate_ann_assign(
-                target=name,
-                annotation=annotation,
                 lineno=lineno,
-                value=default_value,
-            )
-            field_implementation = self._process_field_implementation(
-                field_implementation, field_schema_name=field_name, field=field
+                class_name=class_name,
+                type_name=type_name,
+                type_fields=type_fields,
+                typename_values=typename_values,
             )
-
             class_def.body.append(field_implementation)
 
             extra_classes.extend(
@@ -276,8 +291,6 @@ class ResultTypesGenerator:
                     extra_bases=self._get_extra_bases_from_mixin_directives(field),
                 )
             )
-            self._save_used_enums(field_types_names)
-            self._save_used_scalars(field_types_names)
 
         if not class_def.body:
             class_def.body.append(generate_pass())
@@ -291,47 +304,93 @@ class ResultTypesGenerator:
 
         return [class_def] + extra_classes
 
+    def _parse_field(
+        self,
+        field: FieldNode,
+        lineno: int,
+        class_name: str,
+        type_name: str,
+        type_fields: Dict[str, GraphQLField],
+        typename_values: Optional[List[str]] = None,
+    ) -> Tuple[ast.AnnAssign, List[FieldNames]]:
+        field_name = self._get_field_name(field)
+        name = self._process_field_name(field_name, field=field)
+        field_definition = self._get_field_from_schema(
+            type_fields, type_name, field.name.value
+        )
+        annotation, default_value, field_types_names = parse_operation_field(
+            schema=self.schema,
+            field=field,
+            type_=cast(CodegenResultFieldType, field_definition.type),
+            directives=field.directives,
+            class_name=class_name + str_to_pascal_case(name),
+            typename_values=typename_values,
+            custom_scalars=self.custom_scalars,
+            fragments_definitions=self.fragments_definitions,
+        )
+        self._save_used_enums_and_scalars(field_types_names)
+
+        field_implementation = generate_ann_assign(
+            target=name,
+            annotation=annotation,
+            lineno=lineno,
+            value=default_value,
+        )
+        field_implementation = self._process_field_implementation(
+            field_implementation, field_schema_name=field_name, field=field
+        )
+        return field_implementation, field_types_names
+
     def _resolve_selection_set(
         self, selection_set: SelectionSetNode, root_type: str = ""
     ) -> Tuple[List[FieldNode], Set[str]]:
-        fields = []
-        fragments = set()
-        for selection in selection_set.selections:
-            if isinstance(selection, FieldNode):
+        fields: List[FieldNode] = []
+        fragments: Set[str] = set()
+        type_map = self.schema.type_map
+        pending = [iter(selection_set.selections)]
+        while pending:
+            selection = next(pending[-1], None)
+            if selection is None:
+                pending.pop()
+            elif isinstance(selection, FieldNode):
                 fields.append(selection)
             elif isinstance(selection, FragmentSpreadNode):
-                fragment_def = self.fragments_definitions[selection.name.value]
-                root_type_def = self.schema.type_map[root_type]
-                fragment_root_type_def = self.schema.type_map[
-                    fragment_def.type_condition.name.value
-                ]
+                fragment_name = selection.name.value
+                fragment_def = self.fragments_definitions[fragment_name]
+                fragment_type_name = fragment_def.type_condition.name.value
+                root_type_def = type_map[root_type]
+                fragment_root_type_def = type_map[fragment_type_name]
                 if not self._unpack_fragment(fragment_def, root_type_def):
-                    fragments.add(selection.name.value)
-                elif fragment_def.type_condition.name.value == root_type or (
+                    fragments.add(fragment_name)
+                elif fragment_type_name == root_type or (
                     is_abstract_type(fragment_root_type_def)
                     and self.schema.is_sub_type(
                         cast(GraphQLAbstractType, fragment_root_type_def),
                         root_type_def,
                     )
                 ):
-                    self._unpacked_fragments.add(selection.name.value)
-                    sub_fields, sub_fragments = self._resolve_selection_set(
-                        fragment_def.selection_set, root_type
+                    self._unpacked_fragments.add(fragment_name)
+                    sub_fields, sub_fragments = self._resolve_fragment_selection_set(
+                        fragment_name, root_type
                     )
                     fields.extend(sub_fields)
-                    fragments = fragments.union(sub_fragments)
+                    fragments.update(sub_fragments)
             elif isinstance(selection, InlineFragmentNode):
                 if selection.type_condition.name.value == root_type:
-                    sub_fields, sub_fragments = self._resolve_selection_set(
-                        selection.selection_set, root_type
-                    )
-                    fields.extend(sub_fields)
-                    fragments = fragments.union(sub_fragments)
-        self._fragments_used_as_mixins = self._fragments_used_as_mixins.union(
-            set(fragments)
-        )
+                    pending.append(iter(selection.selection_set.selections))
+        self._fragments_used_as_mixins.update(fragments)
         return fields, fragments
 
+    def _resolve_fragment_selection_set(
+        self, fragment_name: str, root_type: str
+    ) -> Tuple[List[FieldNode], Set[str]]:
+        key = (fragment_name, root_type)
+        if key not in self._resolved_fragments:
+            self._resolved_fragments[key] = self._resolve_selection_set(
+                self.fragments_definitions[fragment_name].selection_set, root_type
+            )
+        return self._resolved_fragments[key]
+
     def _unpack_fragment(
         self,
         fragment_def: FragmentDefinitionNode,
@@ -381,16 +440,14 @@ class ResultTypesGenerator:
             handle_pydantic_resrved_field_names=True,
         )
 
-    def _get_field_from_schema(self, type_name: str, field_name: str) -> GraphQLField:
+    def _get_field_from_schema(
+        self, type_fields: Dict[str, GraphQLField], type_name: str, field_name: str
+    ) -> GraphQLField:
         try:
-            return cast(GraphQLObjectType, self.schema.type_map[type_name]).fields[
-                field_name
-            ]
+            return type_fields[field_name]
         except KeyError as exc:
             if field_name == TYPENAME_FIELD_NAME:
-                return GraphQLField(
-                    type_=GraphQLNonNull(type_=GraphQLScalarType(name="String"))
-                )
+                return self._typename_field
             raise ParsingError(
                 f"Field {field_name} not found in type {type_name}."
             ) from exc
@@ -469,23 +526,27 @@ class ResultTypesGenerator:
         field_types_names: List[FieldNames],
         extra_bases: Optional[List[str]] = None,
     ) -> List[ast.ClassDef]:
-        if selection_set:
-            generated_classes = []
-            add_typename = len(field_types_names) > 1
-            typename_values = self._get_typename_values(field_types_names)
-            for field_type_names in field_types_names:
-                generated_classes.extend(
-                    self._parse_type_definition(
-                        class_name=field_type_names.class_name,
-                        type_name=field_type_names.type_name,
-                        selection_set=selection_set,
-                        add_typename=add_typename,
-                        extra_bases=extra_bases,
-                        typename_values=typename_values[field_type_names.type_name],
-                    )
+        unparsed_types_names = [
+            n for n in field_types_names if n.class_name not in self._parsed_class_names
+        ]
+        if not selection_set or not unparsed_types_names:
+            return []
+
+        generated_classes = []
+        add_typename = len(field_types_names) > 1
+        typename_values = self._get_typename_values(field_types_names)
+        for field_type_names in unparsed_types_names:
+            generated_classes.extend(
+                self._parse_type_definition(
+                    class_name=field_type_names.class_name,
+                    type_name=field_type_names.type_name,
+                    selection_set=selection_set,
+                    add_typename=add_typename,
+                    extra_bases=extra_bases,
+                    typename_values=typename_values[field_type_names.type_name],
                 )
-            return generated_classes
-        return []
+            )
+        return generated_classes
 
     def _get_typename_values(
         self, field_types_names: List[FieldNames]
@@ -506,22 +567,19 @@ class ResultTypesGenerator:
         result[abstract_type.name].extend(types_without_class)
         return result
 
-    def _save_used_enums(self, field_types_names: List[FieldNames]):
-        for field_type_name in field_types_names:
-            if isinstance(
-                self.schema.type_map.get(field_type_name.type_name), GraphQLEnumType
-            ):
-                self._used_enums.append(field_type_name.type_name)
-
-    def _save_used_scalars(self, field_types_names: List[FieldNames]):
+    def _save_used_enums_and_scalars(self, field_types_names: List[FieldNames]) -> None:
+        get_type = self.schema.type_map.get
         for field_type_name in field_types_names:
-            if field_type_name.type_name in self.custom_scalars:
-                self._used_scalars.append(field_type_name.type_name)
+            type_name = field_type_name.type_name
+            if type_name in self.custom_scalars:
+                self._used_scalars.setdefault(type_name, None)
+            elif isinstance(get_type(type_name), GraphQLEnumType):
+                self._used_enums.setdefault(type_name, None)
 
     def _add_enums_scalars_fragments_imports(self):
         if self._used_enums:
             self._imports.append(
-                generate_import_from(self._used_enums, self.enums_module_name, 1)
+                generate_import_from(list(self._used_enums), self.enums_module_name, 1)
             )
 
         for scalar_name in self._used_scalars:
@@ -545,10 +603,11 @@ class ResultTypesGenerator:
         fragments_names: Set[str] = self._fragments_used_as_mixins.copy()
         for fragment_name in self._fragments_used_as_mixins:
             fragment_def = self.fragments_definitions[fragment_name]
-            fragments_names = fragments_names.union(
+            fragments_names.update(
                 self._get_fragments_names(fragment_def.selection_set)
             )
-        return fragments_names.union(self._unpacked_fragments)
+        fragments_names.update(self._unpacked_fragments)
+        return fragments_names
 
     def _get_fragments_names(self, selection_set: SelectionSetNode) -> Set[str]:
         names: Set[str] = set()
@@ -556,7 +615,7 @@ class ResultTypesGenerator:
             if isinstance(node, FragmentSpreadNode):
                 name = node.name.value
                 names.add(name)
-                names = names.union(
+                names.update(
                     self._get_fragments_names(
                         self.fragments_definitions[name].selection_set
                     )
@@ -564,7 +623,7 @@ class ResultTypesGenerator:
             elif (
                 isinstance(node, (FieldNode, InlineFragmentNode)) and node.selection_set
             ):
-                names = names.union(self._get_fragments_names(node.selection_set))
+                names.update(self._get_fragments_names(node.selection_set))
         return names
 
     def _get_node_without_mixin_directive(self, node: Node) -> Node:
@@ -1,5 +1,6 @@
 import ast
 import re
+from functools import lru_cache
 from keyword import iskeyword
 from textwrap import indent
 from typing import Optional
@@ -37,6 +38,7 @@ def str_to_snake_case(name: str) -> str:
     return result[1:] if result.startswith("_") else result
 
 
+@lru_cache(maxsize=None)
 def str_to_pascal_case(name: str) -> str:
     """Converts snake_case string into PascalCase."""
     return "".join(n[:1].upper() + n[1:] for n in name.split("_"))
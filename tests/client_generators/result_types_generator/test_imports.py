@@ -37,6 +37,35 @@ def test_generate_returns_module_with_enum_imports():
     )
 
 
+def test_generate_returns_module_with_single_import_of_repeated_enum():
+    query_str = """
+    query CustomQuery($id: ID!) {
+        query1(id: $id) {
+            field3
+        }
+        camelCaseQuery {
+            field3
+        }
+    }
+    """
+    operation_definition = cast(
+        OperationDefinitionNode, parse(query_str).definitions[0]
+    )
+    generator = ResultTypesGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        operation_definition=operation_definition,
+        enums_module_name="enums",
+    )
+
+    module = generator.generate()
+
+    import_ = filter_imports(module)[-1]
+    assert compare_ast(
+        import_,
+        ast.ImportFrom(module="enums", names=[ast.alias("CustomEnum")], level=1),
+    )
+
+
 def test_generate_returns_module_with_used_custom_scalars_imports():
     query_str = """
     query CustomQuery {
@@ -1,10 +1,12 @@
 import ast
 from typing import cast
 
+import pytest
 from graphql import FragmentDefinitionNode, build_schema, parse
 
 from ariadne_codegen.client_generators.constants import BASE_MODEL_CLASS_NAME
 from ariadne_codegen.client_generators.result_types import ResultTypesGenerator
+from ariadne_codegen.exceptions import ParsingError
 
 from ...utils import compare_ast
 from .schema import SCHEMA_STR
@@ -228,3 +230,17 @@ def test_get_imports_returns_mixin_imports():
         mixin_imports[0],
         ast.ImportFrom(module=".test_mixins", names=[ast.alias("TestMixinA")], level=0),
     )
+
+
+def test_generator_raises_parsing_error_for_fragment_on_unknown_type():
+    fragment_definition = cast(
+        FragmentDefinitionNode,
+        parse("fragment TestFragment on MissingType { id }").definitions[0],
+    )
+
+    with pytest.raises(ParsingError):
+        ResultTypesGenerator(
+            schema=build_schema(SCHEMA_STR),
+            operation_definition=fragment_definition,
+            enums_module_name="enums",
+        )
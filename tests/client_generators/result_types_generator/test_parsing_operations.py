@@ -1,5 +1,5 @@
 import ast
-from typing import Tuple, cast
+from typing import List, Tuple, cast
 
 import pytest
 from graphql import FragmentDefinitionNode, OperationDefinitionNode, build_schema, parse
@@ -717,3 +717,111 @@ def test_generate_returns_module_for_schema_with_custom_operation_type_name(
     class_defs = filter_class_defs(module)
     assert len(class_defs) == 1
     assert compare_ast(class_defs[0], expected_class_def)
+
+
+def test_generate_returns_module_with_single_class_for_repeated_field():
+    query_str = """
+    query CustomQuery {
+        query2 {
+            id
+        }
+        query2 {
+            id
+        }
+    }
+    """
+    generator = ResultTypesGenerator(
+        schema=build_schema(SCHEMA_STR),
+        operation_definition=cast(
+            OperationDefinitionNode, parse(query_str).definitions[0]
+        ),
+        enums_module_name="enums",
+    )
+
+    module = generator.generate()
+
+    class_defs = filter_class_defs(module)
+    assert [c.name for c in class_defs] == ["CustomQuery", "CustomQueryQuery2"]
+    assert generator.get_generated_public_names() == [
+        "CustomQuery",
+        "CustomQueryQuery2",
+    ]
+
+
+def test_generate_returns_module_with_fragment_unpacked_in_every_spread():
+    query_str = """
+    query CustomQuery {
+        query4 {
+            ...UnionFragment
+        }
+        camelCaseQuery {
+            unionField {
+                ...UnionFragment
+            }
+        }
+    }
+
+    fragment UnionFragment on UnionType {
+        ... on CustomType1 {
+            fielda
+        }
+        ... on CustomType2 {
+            fieldb
+        }
+    }
+    """
+    document = parse(query_str)
+    generator = ResultTypesGenerator(
+        schema=build_schema(SCHEMA_STR),
+        operation_definition=cast(OperationDefinitionNode, document.definitions[0]),
+        enums_module_name="enums",
+        fragments_definitions={
+            "UnionFragment": cast(FragmentDefinitionNode, document.definitions[1])
+        },
+    )
+
+    module = generator.generate()
+
+    class_defs = {c.name: c for c in filter_class_defs(module)}
+    for prefix in ("CustomQueryQuery4", "CustomQueryCamelCaseQueryUnionField"):
+        assert [
+            cast(ast.Name, f.target).id
+            for f in cast(List[ast.AnnAssign], class_defs[prefix + "CustomType1"].body)
+        ] == [TYPENAME_ALIAS, "fielda"]
+        assert [
+            cast(ast.Name, f.target).id
+            for f in cast(List[ast.AnnAssign], class_defs[prefix + "CustomType2"].body)
+        ] == [TYPENAME_ALIAS, "fieldb"]
+    assert generator.get_unpacked_fragments() == {"UnionFragment"}
+
+
+def test_generate_returns_module_with_inline_fragments_fields_in_selection_order():
+    query_str = """
+    query CustomQuery {
+        camelCaseQuery {
+            id
+            ... on CustomType {
+                field3
+                ... on CustomType {
+                    _field4
+                }
+            }
+            schema
+        }
+    }
+    """
+    generator = ResultTypesGenerator(
+        schema=build_schema(SCHEMA_STR),
+        operation_definition=cast(
+            OperationDefinitionNode, parse(query_str).definitions[0]
+        ),
+        enums_module_name="enums",
+    )
+
+    module = generator.generate()
+
+    class_defs = {c.name: c for c in filter_class_defs(module)}
+    assert [
+        cast(ast.Name, f.target).id
+        for f in cast(List[ast.AnnAssign], class_defs["CustomQueryCamelCaseQuery"].body)
+    ] == ["id", "field3", "field4", "schema_"]
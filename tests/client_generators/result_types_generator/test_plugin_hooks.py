@@ -41,6 +41,26 @@ def test_get_operation_as_str_triggers_generate_operation_str_hook(
     assert mocked_plugin_manager.generate_operation_str.called
 
 
+def test_get_operation_as_str_triggers_generate_operation_str_hook_once(
+    mocked_plugin_manager,
+):
+    query_str = "query CustomQuery { camelCaseQuery { id } }"
+    generator = ResultTypesGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        operation_definition=cast(
+            OperationDefinitionNode, parse(query_str).definitions[0]
+        ),
+        enums_module_name="enums",
+        plugin_manager=mocked_plugin_manager,
+    )
+
+    first_result = generator.get_operation_as_str()
+    second_result = generator.get_operation_as_str()
+
+    assert first_result is second_result
+    assert mocked_plugin_manager.generate_operation_str.call_count == 1
+
+
 def test_generator_triggers_generate_result_class_hook_for_every_class(
     mocked_plugin_manager,
 ):